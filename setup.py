@@ -1,13 +1,13 @@
 #!/usr/bin/env python
 # coding: utf-8
 
-import os
+from pathlib import Path
 
 from setuptools import find_packages, setup
 
 
 def read(fname):
-    return open(os.path.join(os.path.dirname(__file__), fname)).read()
+    return (Path(__file__).parent / fname).read_text(encoding="utf-8")
 
 
 setup(
@@ -9,20 +9,96 @@ combining configurations, finding checkpoints, and submitting batch jobs.
 It handles the core configuration logic that powers the pipeline execution.
 """
 
+import gc
 import logging
 import os
+import pickle
+import shlex
+import zipfile
+from functools import lru_cache
 from itertools import product
 
 import torch
 import yaml
-from more_itertools import collapse
 from simple_slurm import Slurm
 
+# Prefer the libyaml-backed loader when PyYAML was built against libyaml
+Loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+@lru_cache(maxsize=None)
+def _log_yaml_loader():
+    """Log the resolved YAML loader once, after logging has been configured."""
+    logging.debug(
+        f"YAML loader: {Loader.__name__}"
+        + ("" if Loader is not yaml.SafeLoader else " (libyaml not available)")
+    )
+
+
+def _search_tree(path, match):
+    """
+    Walk a directory tree and return the first entry accepted by ``match``.
+
+    Each directory is fully scanned before any of its subdirectories, as with
+    ``os.walk``, but ``os.scandir`` is used directly so that entry types come
+    from the cached ``readdir`` data rather than an extra ``stat`` per entry.
+
+    Args:
+        path (str): Base path to search in
+        match (callable): Predicate taking an ``os.DirEntry``
+
+    Returns:
+        str: Path of the first matching entry, or None if not found
+    """
+    stack = [path]
+    while stack:
+        subdirs = []
+        try:
+            with os.scandir(stack.pop()) as it:
+                for entry in it:
+                    if match(entry):
+                        return entry.path
+                    if entry.is_dir(follow_symlinks=False):
+                        subdirs.append(entry.path)
+        except OSError:
+            continue
+        stack.extend(reversed(subdirs))
+
+
+@lru_cache(maxsize=None)
+def _find_library_entry(name, path, is_dir):
+    """
+    Find a file or directory by name under a library path, caching the result.
+
+    Args:
+        name (str): Entry name to search for
+        path (str): Base path to search in
+        is_dir (bool): Whether to look for a directory rather than a file
+
+    Returns:
+        str: Full path to the found entry, or None if not found
+    """
+    return _search_tree(
+        path, lambda entry: entry.name == name and entry.is_dir() == is_dir
+    )
+
+
+def _find_cached(name, path, is_dir):
+    """Look up ``_find_library_entry`` without keeping misses in its cache."""
+    found = _find_library_entry(name, path, is_dir)
+    if found is None:
+        # The entry may still be created later in this process
+        _find_library_entry.cache_clear()
+    return found
+
 
 def find_checkpoint(run_id, path):
     """
     Find a checkpoint file for a specific run ID.
 
+    Successful searches are cached per ``(run_id, path)``, so later stages do not
+    walk the artifact library again.
+
     Args:
         run_id (str): The run ID to search for
         path (str): Base path to search in
@@ -30,10 +106,118 @@ def find_checkpoint(run_id, path):
     Returns:
         str: Path to the checkpoint file, or None if not found
     """
-    for root_dir, dirs, files in os.walk(path):
-        if run_id in dirs:
-            latest_run_path = os.path.join(root_dir, run_id, "checkpoints/last.ckpt")
-            return latest_run_path
+    run_dir = _find_cached(run_id, path, True)
+    if run_dir is not None:
+        return os.path.join(run_dir, "checkpoints/last.ckpt")
+
+
+class _SkippedTensor:
+    """Placeholder returned in place of tensors that are never materialized."""
+
+    def __new__(cls, *args, **kwargs):
+        return object.__new__(cls)
+
+    def __init__(self, *args, **kwargs):
+        pass
+
+    def __setstate__(self, state):
+        pass
+
+
+class _HyperParameterUnpickler(pickle.Unpickler):
+    """
+    Unpickle a checkpoint's ``data.pkl`` without restoring any tensor storages.
+
+    Storage references resolve to None and torch's tensor rebuild functions are
+    replaced by ``_SkippedTensor``, so only the plain Python parts (such as
+    ``hyper_parameters``) are deserialized.
+    """
+
+    def find_class(self, module, name):
+        if module.startswith("torch") and name.startswith("_rebuild"):
+            return _SkippedTensor
+        return super().find_class(module, name)
+
+    def persistent_load(self, pid):
+        return None
+
+
+def _contains_skipped_tensor(node, seen=None):
+    """
+    Check whether an unpickled object holds any ``_SkippedTensor`` placeholders.
+
+    Args:
+        node: Object to search, containers, ``__dict__`` and ``__slots__``
+            attributes are recursed into
+        seen (set, optional): Ids of objects already visited
+
+    Returns:
+        bool: True if a placeholder was found
+    """
+    if isinstance(node, _SkippedTensor):
+        return True
+    seen = set() if seen is None else seen
+    if id(node) in seen:
+        return False
+    seen.add(id(node))
+
+    if isinstance(node, dict):
+        children = [*node.keys(), *node.values()]
+    elif isinstance(node, (list, tuple, set, frozenset)):
+        children = node
+    else:
+        children = list(getattr(node, "__dict__", {}).values())
+        for cls in type(node).__mro__:
+            slots = cls.__dict__.get("__slots__", ())
+            for slot in (slots,) if isinstance(slots, str) else slots:
+                if slot not in ("__dict__", "__weakref__") and hasattr(node, slot):
+                    children.append(getattr(node, slot))
+    return any(_contains_skipped_tensor(child, seen) for child in children)
+
+
+def load_hyper_parameters(ckpnt_path):
+    """
+    Read the hyperparameters stored in a Lightning checkpoint.
+
+    The checkpoint archive is inspected directly so that none of the model or
+    optimizer weights are read. If that fails, or the hyperparameters themselves
+    contain tensors, it falls back to ``torch.load`` on CPU, memory-mapped where
+    possible and with ``weights_only`` unless the hyperparameters need arbitrary
+    unpickling.
+
+    Args:
+        ckpnt_path (str): Path to the checkpoint file
+
+    Returns:
+        dict: The ``hyper_parameters`` entry of the checkpoint
+    """
+    try:
+        with zipfile.ZipFile(ckpnt_path) as archive:
+            data_pkl = next(n for n in archive.namelist() if n.endswith("data.pkl"))
+            with archive.open(data_pkl) as f:
+                config = _HyperParameterUnpickler(f).load()["hyper_parameters"]
+        if not _contains_skipped_tensor(config):
+            return config
+        logging.debug(f"Hyperparameters in {ckpnt_path} hold tensors, using torch.load")
+    except Exception as e:
+        # The lazy read is only an optimization, torch.load remains authoritative
+        logging.debug(f"Could not read {ckpnt_path} lazily ({e}), using torch.load")
+
+    # mmap is only supported for zip-format checkpoints
+    load_kwargs = dict(
+        map_location=torch.device("cpu"), mmap=zipfile.is_zipfile(ckpnt_path)
+    )
+    try:
+        ckpnt = torch.load(ckpnt_path, weights_only=True, **load_kwargs)
+    except pickle.UnpicklingError:
+        # Hyperparameters may contain custom classes that weights_only rejects
+        ckpnt = torch.load(ckpnt_path, weights_only=False, **load_kwargs)
+
+    config = ckpnt["hyper_parameters"]
+    # Release the (mapped) storages before the rest of the stage is configured
+    del ckpnt
+    gc.collect()
+    return config
 
 
 def handle_config_cases(some_config):
@@ -46,12 +230,11 @@ def handle_config_cases(some_config):
     Returns:
         list: The input converted to a list
     """
-    if type(some_config) is list:
-        return some_config
     if some_config is None:
         return []
-    else:
-        return [some_config]
+    if isinstance(some_config, list):
+        return some_config
+    return [some_config]
 
 
 def submit_batch(config, project_config, running_id=None):
@@ -66,8 +249,9 @@ def submit_batch(config, project_config, running_id=None):
     Returns:
         str: The job ID of the submitted job
     """
+    _log_yaml_loader()
     with open(config["batch_config"]) as f:
-        batch_config = yaml.load(f, Loader=yaml.FullLoader)
+        batch_config = yaml.load(f, Loader=Loader)
 
     command_line_args = dict_to_args(config)
     slurm = Slurm(**batch_config)
@@ -103,6 +287,9 @@ def find_config(name, path):
     """
     Find a configuration file by name in a directory tree.
 
+    Successful searches are cached per ``(name, path)``, so later stages do not
+    walk the model library again.
+
     Args:
         name (str): Filename to search for
         path (str): Base path to search in
@@ -110,9 +297,7 @@ def find_config(name, path):
     Returns:
         str: Full path to the found configuration file, or None if not found
     """
-    for root, dirs, files in os.walk(path):
-        if name in files:
-            return os.path.join(root, name)
+    return _find_cached(name, path, False)
 
 
 def load_config(stage, resume_id, project_config, run_args):
@@ -132,14 +317,18 @@ def load_config(stage, resume_id, project_config, run_args):
     Returns:
         dict: Combined configuration for the stage
     """
+    if project_config.get("rescan_library", False):
+        _find_library_entry.cache_clear()
+
     if resume_id is None:
+        _log_yaml_loader()
         stage_config_file = find_config(
             stage["config"],
             os.path.join(project_config["libraries"]["model_library"], stage["set"]),
         )
 
         with open(stage_config_file) as f:
-            config = yaml.load(os.path.expandvars(f.read()), Loader=yaml.FullLoader)
+            config = yaml.load(os.path.expandvars(f.read()), Loader=Loader)
         config["logger"] = project_config["logger"]
         config["resume_id"] = resume_id
 
@@ -147,8 +336,7 @@ def load_config(stage, resume_id, project_config, run_args):
         ckpnt_path = find_checkpoint(
             resume_id, project_config["libraries"]["artifact_library"]
         )
-        ckpnt = torch.load(ckpnt_path, map_location=torch.device("cpu"))
-        config = ckpnt["hyper_parameters"]
+        config = load_hyper_parameters(ckpnt_path)
         config["checkpoint_path"] = ckpnt_path
 
     if "override" in stage.keys():
@@ -181,14 +369,11 @@ def combo_config(config):
     Returns:
         list: List of configuration dictionaries
     """
-    total_list = {k: (v if type(v) == list else [v]) for (k, v) in config.items()}
-    keys, values = zip(*total_list.items())
+    total_list = {k: (v if isinstance(v, list) else [v]) for (k, v) in config.items()}
+    keys, values = tuple(total_list), tuple(total_list.values())
 
     # Build list of config dictionaries
-    config_list = []
-    [config_list.append(dict(zip(keys, bundle))) for bundle in product(*values)]
-
-    return config_list
+    return [dict(zip(keys, bundle)) for bundle in product(*values)]
 
 
 def dict_to_args(config):
@@ -199,10 +384,15 @@ def dict_to_args(config):
         config (dict): Configuration dictionary
 
     Returns:
-        str: Command-line arguments string
+        str: Command-line arguments string, with values shell-quoted
     """
-    collapsed_list = list(collapse([["--" + k, v] for k, v in config.items()]))
-    collapsed_list = [str(entry) for entry in collapsed_list]
-    command_line_args = " ".join(collapsed_list)
-
-    return command_line_args
+    parts = []
+    append = parts.append
+    for k, v in config.items():
+        append("--" + k)
+        if isinstance(v, (list, tuple)):
+            parts.extend(shlex.quote(str(entry)) for entry in v)
+        else:
+            append(shlex.quote(str(v)))
+
+    return " ".join(parts)
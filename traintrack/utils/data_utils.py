@@ -9,6 +9,14 @@ of values to their appropriate Python types, and includes functionality for
 automatic type casting of function arguments.
 """
 
+
+# Accepted string forms of booleans and None, shared by boolify, nullify and
+# the estimateType fast path so the spellings cannot diverge
+_BOOLS = {"True": True, "true": True, "False": False, "false": False}
+_NONES = {"None": None, "none": None}
+_SCALARS = {**_NONES, **_BOOLS}
+
+
 def boolify(s):
     """
     Convert a string representation of a boolean to a Python bool.
@@ -22,10 +30,8 @@ def boolify(s):
     Raises:
         ValueError: If the string cannot be converted to a boolean
     """
-    if s == "True" or s == "true":
-        return True
-    if s == "False" or s == "false":
-        return False
+    if s in _BOOLS:
+        return _BOOLS[s]
     raise ValueError("Not Boolean Value!")
 
 
@@ -42,7 +48,7 @@ def nullify(s):
     Raises:
         ValueError: If the string cannot be converted to None
     """
-    if s == "None" or s == "none":
+    if s in _NONES:
         return None
     raise ValueError("Not None type!")
 
@@ -62,19 +68,30 @@ def estimateType(var):
         The variable converted to its estimated Python type. If the input
         is a list, returns a list with all elements converted.
     """
-    if type(var) is list:
+    if isinstance(var, list):
         if len(var) == 1:
             return estimateType(var[0])
         else:
             return [estimateType(varEntry) for varEntry in var]
+    elif var is None or isinstance(var, (bool, int, float)):
+        return var  # already typed, e.g. when called from Python rather than the CLI
     else:
-        var = str(var)  # important if the parameters aren't strings...
-        for caster in (nullify, boolify, int, float):
-            try:
-                return caster(var)
-            except ValueError:
-                pass
-    return var
+        if not isinstance(var, str):
+            var = str(var)  # important if the parameters aren't strings...
+        if var in _SCALARS:
+            return _SCALARS[var]
+        digits = var[1:] if var.startswith(("-", "+")) else var
+        if digits.isdecimal():
+            return int(var)
+        try:
+            value = float(var)
+        except ValueError:
+            return var
+        # Strings like " 5" or "1_000" are still integers to int()
+        try:
+            return int(var)
+        except ValueError:
+            return value
 
 
 def autocast(dFxn):
@@ -93,7 +110,7 @@ def autocast(dFxn):
     """
     def wrapped(*c, **d):
         cp = [estimateType(x) for x in c]
-        dp = dict((i, estimateType(j)) for (i, j) in d.items())
+        dp = {i: estimateType(j) for i, j in d.items()}
         return dFxn(*cp, **dp)
 
     return wrapped
@@ -13,6 +13,18 @@ import logging
 import os
 import sys
 
+# Third-party loggers that are always capped at WARNING
+_QUIET_LOGGERS = ("lightning.pytorch", "pytorch_lightning", "matplotlib", "PIL")
+
+# Shared by the console and file handlers
+_FORMATTER = logging.Formatter(
+    "%(asctime)s - %(levelname)s - %(message)s", datefmt="%Y-%m-%d %H:%M:%S"
+)
+
+# The (log_dir, verbose) arguments of the last successful configuration and the
+# handlers it installed, or None
+_CONFIGURED = None
+
 
 def configure_logging(log_dir=None, verbose=False):
     """
@@ -20,7 +32,9 @@ def configure_logging(log_dir=None, verbose=False):
 
     This function sets up logging with consistent formatting for both console
     and file outputs. It configures the root logger with appropriate handlers
-    and formatting.
+    and formatting. Repeated calls with the same arguments return the already
+    configured root logger without touching its handlers, as long as those
+    handlers are still attached.
 
     Args:
         log_dir (str, optional): Path to log file. If None, only console logging is configured.
@@ -32,58 +46,56 @@ def configure_logging(log_dir=None, verbose=False):
     Returns:
         logging.Logger: The configured root logger
     """
+    global _CONFIGURED
+    root_logger = logging.getLogger()
+    if _CONFIGURED is not None and _CONFIGURED[0] == (log_dir, verbose):
+        if all(handler in root_logger.handlers for handler in _CONFIGURED[1]):
+            return root_logger
+    _CONFIGURED = None
+
     # Determine log level based on verbose flag
     log_level = logging.DEBUG if verbose else logging.WARNING
 
     # Configure root logger
-    root_logger = logging.getLogger()
     root_logger.setLevel(log_level)
 
     # Remove any existing handlers to avoid duplicates
-    for handler in root_logger.handlers[:]:
-        root_logger.removeHandler(handler)
+    root_logger.handlers.clear()
 
     # Create console handler with appropriate formatting
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(log_level)
-    console_format = logging.Formatter(
-        "%(asctime)s - %(levelname)s - %(message)s", datefmt="%Y-%m-%d %H:%M:%S"
-    )
-    console_handler.setFormatter(console_format)
+    console_handler.setFormatter(_FORMATTER)
     root_logger.addHandler(console_handler)
 
     # Set up file logging if log_dir is provided
+    configured = True
     if log_dir:
         try:
             # Create parent directory for log file if needed
             log_parent_dir = os.path.dirname(log_dir)
-            if log_parent_dir and not os.path.exists(log_parent_dir):
+            if log_parent_dir:
                 os.makedirs(log_parent_dir, exist_ok=True)
 
             # Set up file handler
             file_handler = logging.FileHandler(log_dir)
             file_handler.setLevel(logging.INFO)  # Always log INFO and above to file
-            file_format = logging.Formatter(
-                "%(asctime)s - %(levelname)s - %(message)s", datefmt="%Y-%m-%d %H:%M:%S"
-            )
-            file_handler.setFormatter(file_format)
+            file_handler.setFormatter(_FORMATTER)
             root_logger.addHandler(file_handler)
             logging.info(f"Log file created at {log_dir}")
         except Exception as e:
             print(f"Warning: Could not create log file {log_dir}: {e}")
             print("Continuing with console logging only")
+            configured = False
 
-    # Configure Lightning loggers
-    for logger_name in ["lightning.pytorch", "pytorch_lightning"]:
-        lightning_logger = logging.getLogger(logger_name)
-        lightning_logger.setLevel(
-            logging.WARNING
-        )  # Always set Lightning loggers to WARNING
-
-    # Set other verbose loggers to WARNING level
-    for logger_name in ["matplotlib", "PIL"]:
+    # Set Lightning and other verbose loggers to WARNING level
+    for logger_name in _QUIET_LOGGERS:
         logging.getLogger(logger_name).setLevel(logging.WARNING)
 
     logging.debug(f"Logging configured with level: {'DEBUG' if verbose else 'WARNING'}")
 
+    # Only skip reconfiguration next time if everything was set up
+    if configured:
+        _CONFIGURED = ((log_dir, verbose), tuple(root_logger.handlers))
+
     return root_logger
@@ -12,6 +12,8 @@ the pipeline execution, with a focus on PyTorch Lightning integration.
 import importlib
 import logging
 import os
+import re
+from functools import lru_cache
 
 import torch
 from lightning.pytorch import Trainer
@@ -21,10 +23,117 @@ from lightning.pytorch.loggers import TensorBoardLogger, WandbLogger
 from .config_utils import handle_config_cases
 
 
+# Top-level class definitions, found without importing the module
+_CLASS_DEF = re.compile(r"^class\s+(\w+)", re.MULTILINE)
+
+
+def _list_modules(model_set, model_library):
+    """
+    List the public modules in a set's Models directory.
+
+    Args:
+        model_set (str): The module set to list (e.g., 'edge_construction')
+        model_library (str): Path to the model library directory
+
+    Returns:
+        list: Tuples of (module name, file path)
+    """
+    with os.scandir(os.path.join(model_library, model_set, "Models")) as it:
+        return [
+            (entry.name[:-3], entry.path)
+            for entry in it
+            if entry.name.endswith(".py") and not entry.name.startswith("_")
+        ]
+
+
+def _exported_names(mod):
+    """Names a module exports: its ``__all__``, or else its public attributes."""
+    names = getattr(mod, "__all__", None)
+    if names is None:
+        names = [n for n in dir(mod) if not n.startswith("_")]
+    return names
+
+
+@lru_cache(maxsize=None)
+def _class_index(model_set, model_library):
+    """
+    Map the classes defined in a set's Models directory to their modules.
+
+    The source files are only scanned for ``class`` statements, none of them
+    are imported.
+
+    Args:
+        model_set (str): The module set to index (e.g., 'edge_construction')
+        model_library (str): Path to the model library directory
+
+    Returns:
+        dict: Mapping of class name to module name, first module wins on clashes
+    """
+    index = {}
+    for module, path in _list_modules(model_set, model_library):
+        with open(path, encoding="utf-8") as f:
+            for name in _CLASS_DEF.findall(f.read()):
+                index.setdefault(name, module)
+
+    return index
+
+
+@lru_cache(maxsize=None)
+def _model_index(model_set, model_library):
+    """
+    Import every module in a set's Models directory and index its exported names.
+
+    This is only needed for names that are not defined by a ``class`` statement
+    in the set itself, e.g. callbacks re-exported from another package.
+
+    Args:
+        model_set (str): The module set to index (e.g., 'edge_construction')
+        model_library (str): Path to the model library directory
+
+    Returns:
+        dict: Mapping of exported name to object, first module wins on clashes
+    """
+    index = {}
+    for module, _ in _list_modules(model_set, model_library):
+        mod = importlib.import_module(".".join([model_set, "Models", module]))
+        for name in _exported_names(mod):
+            index.setdefault(name, getattr(mod, name))
+
+    return index
+
+
+@lru_cache(maxsize=None)
+def _load_model(model_set, model_name, model_library):
+    """
+    Import only the module defining ``model_name`` and return the class.
+
+    Falls back to importing the whole set when no module defines the name.
+
+    Args:
+        model_set (str): The module set to search in (e.g., 'edge_construction')
+        model_name (str): The name of the model or callback class to find
+        model_library (str): Path to the model library directory
+
+    Returns:
+        class: The found model or callback class, or None if not found
+    """
+    module = _class_index(model_set, model_library).get(model_name)
+    if module is not None:
+        mod = importlib.import_module(".".join([model_set, "Models", module]))
+        if model_name in _exported_names(mod):
+            return getattr(mod, model_name)
+
+    return _model_index(model_set, model_library).get(model_name)
+
+
 def find_model(model_set, model_name, model_library):
     """
     Find a model or callback class by name in the model library.
 
+    Only the module that defines the requested class is imported, and each
+    lookup is cached, so repeated lookups (e.g. one per callback) do not
+    touch the filesystem or the import system again.
+
     Args:
         model_set (str): The module set to search in (e.g., 'edge_construction')
         model_name (str): The name of the model or callback class to find
@@ -33,30 +142,9 @@ def find_model(model_set, model_name, model_library):
     Returns:
         class: The found model or callback class, or None if not found
     """
-    # List all modules in the set/ and set/Models directories
-    module_list = [
-        os.path.splitext(name)[0]
-        for name in os.listdir(os.path.join(model_library, model_set, "Models"))
-        if name.endswith(".py")
-    ]
-
-    # Import all modules in the set/Models directory and find model_name
-    imported_module_list = [
-        importlib.import_module(".".join([model_set, "Models", module]))
-        for module in module_list
-    ]
-    names = [
-        mod
-        for mod in imported_module_list
-        if model_name
-        in getattr(mod, "__all__", [n for n in dir(mod) if not n.startswith("_")])
-    ]
-    if len(names) == 0:
+    model_class = _load_model(model_set, model_name, model_library)
+    if model_class is None:
         print("Couldn't find model or callback", model_name)
-        return None
-
-    # Return the class of model_name
-    model_class = getattr(names[0], model_name)
 
     return model_class
 
@@ -128,12 +216,40 @@ def get_training_logger(model_config):
     return logger
 
 
+@lru_cache(maxsize=None)
+def _resolve_callbacks(model_set, model_library, callbacks):
+    """
+    Find the callback classes named in a configuration.
+
+    Args:
+        model_set (str): The module set the callbacks live in
+        model_library (str): Path to the model library directory
+        callbacks (tuple): Names of the callback classes
+
+    Returns:
+        tuple: The callback classes, in the order given
+
+    Raises:
+        ValueError: If a callback class cannot be found
+    """
+    callback_classes = []
+    for callback in callbacks:
+        callback_class = find_model(model_set, callback, model_library)
+        if callback_class is None:
+            raise ValueError(f"Could not find callback {callback} in {model_set}")
+        callback_classes.append(callback_class)
+
+    logging.info(f"Callbacks found: {list(callbacks)}")
+    return tuple(callback_classes)
+
+
 def callback_objects(model_config, lr_logger=False):
     """
     Build callback objects from configuration.
 
     This function creates and returns callback objects for PyTorch Lightning
-    based on the provided configuration.
+    based on the provided configuration. The callback classes are resolved
+    once per set of names and reused afterwards.
 
     Args:
         model_config (dict): Configuration dictionary
@@ -141,68 +257,57 @@ def callback_objects(model_config, lr_logger=False):
 
     Returns:
         list: List of instantiated callback objects
+
+    Raises:
+        ValueError: If a callback class cannot be found
     """
-    callback_list = (
-        model_config["callbacks"] if "callbacks" in model_config.keys() else None
+    callback_classes = _resolve_callbacks(
+        model_config["set"],
+        model_config["model_library"],
+        tuple(handle_config_cases(model_config.get("callbacks"))),
     )
-    callback_list = handle_config_cases(callback_list)
-
-    model_set = model_config["set"]
-    model_library = model_config["model_library"]
-    callback_object_list = [
-        find_model(model_set, callback, model_library)() for callback in callback_list
-    ]
+    callback_object_list = [callback_class() for callback_class in callback_classes]
 
     if lr_logger:
         lr_monitor = LearningRateMonitor(logging_interval="epoch")
         callback_object_list = callback_object_list + [lr_monitor]
 
-    logging.info(f"Callbacks found: {callback_list}")
     return callback_object_list
 
 
-def build_trainer(model_config, logger):
+@lru_cache(maxsize=None)
+def _trainer_factory(model_set, model_library, callbacks, fom, fom_mode, sanity_steps):
     """
-    Build a PyTorch Lightning Trainer from configuration.
-
-    This function creates and configures a PyTorch Lightning Trainer
-    with appropriate callbacks, devices, and other settings based on
-    the provided configuration.
+    Resolve the run-independent Trainer settings once and return a builder.
 
     Args:
-        model_config (dict): Configuration dictionary
-        logger: PyTorch Lightning logger instance
+        model_set (str): The module set the callbacks live in
+        model_library (str): Path to the model library directory
+        callbacks (tuple): Names of the callback classes to attach
+        fom (str): Metric monitored by the checkpoint callback
+        fom_mode (str): Whether ``fom`` should be minimized or maximized
+        sanity_steps (int): Number of sanity validation steps
 
     Returns:
-        Trainer: Configured PyTorch Lightning Trainer instance
-    """
+        callable: Function taking ``(model_config, logger)`` and returning a Trainer
 
-    fom = model_config["fom"] if "fom" in model_config.keys() else "val_loss"
-    fom_mode = model_config["fom_mode"] if "fom_mode" in model_config.keys() else "min"
-
-    checkpoint_callback = ModelCheckpoint(
-        monitor=fom, save_top_k=2, save_last=True, mode=fom_mode
-    )
+    Raises:
+        ValueError: If a callback class cannot be found
+    """
+    # Fail when the factory is built rather than on every later build() call
+    _resolve_callbacks(model_set, model_library, callbacks)
 
     # Always use at least 1 device (1 for CPU or GPU, 'auto' for multiple GPUs)
     devices = "auto" if torch.cuda.is_available() else 1
 
-    # Set default num_sanity_val_steps or get from config
-    num_sanity_val_steps = model_config.get("sanity_steps", 2)
-
     # Always use 0 workers to prevent excessive process spawning
     # This can be overridden for production use
     num_workers = 0
     logging.info(f"Using {num_workers} worker processes for data loading")
 
-    # Single trainer initialization for all cases
-    # In Lightning 2.0+, resuming is handled in trainer.fit() with ckpt_path
-    trainer = Trainer(
-        max_epochs=model_config["max_epochs"],
+    trainer_kwargs = dict(
         devices=devices,
-        num_sanity_val_steps=num_sanity_val_steps,
-        logger=logger,
-        callbacks=callback_objects(model_config) + [checkpoint_callback],
+        num_sanity_val_steps=sanity_steps,
         strategy="auto",  # Use "ddp" for distributed training, "auto" for single GPU
         enable_checkpointing=True,
         enable_progress_bar=True,
@@ -210,8 +315,66 @@ def build_trainer(model_config, logger):
         log_every_n_steps=1,  # Reduce logging frequency
     )
 
-    logging.info(f"Trainer built with devices={devices}")
-    return trainer
+    def build(model_config, logger):
+        checkpoint_callback = ModelCheckpoint(
+            monitor=fom, save_top_k=2, save_last=True, mode=fom_mode
+        )
+
+        # Single trainer initialization for all cases
+        # In Lightning 2.0+, resuming is handled in trainer.fit() with ckpt_path
+        trainer = Trainer(
+            max_epochs=model_config["max_epochs"],
+            logger=logger,
+            callbacks=callback_objects(model_config) + [checkpoint_callback],
+            **trainer_kwargs,
+        )
+
+        logging.info(f"Trainer built with devices={devices}")
+        return trainer
+
+    return build
+
+
+def compile_trainer_factory(model_config):
+    """
+    Get a Trainer builder specialized to the shape of a configuration.
+
+    Everything that does not change between runs of the same stage (callback
+    classes, checkpoint metric, sanity steps, devices) is resolved once and
+    cached, so a hyperparameter sweep only pays for instantiating the Trainer.
+
+    Args:
+        model_config (dict): Configuration dictionary
+
+    Returns:
+        callable: Function taking ``(model_config, logger)`` and returning a Trainer
+    """
+    return _trainer_factory(
+        model_config["set"],
+        model_config["model_library"],
+        tuple(handle_config_cases(model_config.get("callbacks"))),
+        model_config.get("fom", "val_loss"),
+        model_config.get("fom_mode", "min"),
+        model_config.get("sanity_steps", 2),
+    )
+
+
+def build_trainer(model_config, logger):
+    """
+    Build a PyTorch Lightning Trainer from configuration.
+
+    This function creates and configures a PyTorch Lightning Trainer
+    with appropriate callbacks, devices, and other settings based on
+    the provided configuration.
+
+    Args:
+        model_config (dict): Configuration dictionary
+        logger: PyTorch Lightning logger instance
+
+    Returns:
+        Trainer: Configured PyTorch Lightning Trainer instance
+    """
+    return compile_trainer_factory(model_config)(model_config, logger)
 
 
 def get_resume_id(stage):